@@ -2,20 +2,38 @@
 
 import argparse
 import sys
-from src.pipeline.generator import PipelineGenerator
 from src.pipeline.steps import PipelineStep
 
+def _steps(value):
+    """Argument type for a comma-separated list of pipeline steps, or 'all'."""
+    if value == 'all':
+        return PipelineStep.get_all_steps()
+    steps = [step.strip() for step in value.split(',')]
+    invalid_steps = [step for step in steps if not PipelineStep.validate_step(step)]
+    if invalid_steps:
+        raise argparse.ArgumentTypeError(f"Invalid step specified: {', '.join(invalid_steps)}")
+    return steps
+
 def parse_args():
     parser = argparse.ArgumentParser(description='Generate data processing pipeline scripts')
-    parser.add_argument('-c', '--config', required=True,
+    parser.add_argument('-c', '--config',
                       help='Path to the configuration YAML file')
-    parser.add_argument('-s', '--step', required=True,
-                      help='Single pipeline step to generate')
+    parser.add_argument('-s', '--step', type=_steps, metavar='STEP[,STEP...]',
+                      help='Pipeline step(s) to generate, comma-separated, or "all" '
+                           '(one of: ' + ', '.join(PipelineStep.get_all_steps()) + ')')
     parser.add_argument('-o', '--output-dir', default='generated_scripts',
                       help='Output directory for generated scripts')
     parser.add_argument('--list-steps', action='store_true',
                       help='List available pipeline steps and exit')
-    return parser.parse_args()
+    args = parser.parse_args()
+    
+    # Config and step are only needed when generating a script
+    if not args.list_steps:
+        missing = [opt for opt, value in (('-c/--config', args.config), ('-s/--step', args.step))
+                   if value is None]
+        if missing:
+            parser.error(f"the following arguments are required: {', '.join(missing)}")
+    return args
 
 def main():
     args = parse_args()
@@ -26,18 +44,22 @@ def main():
             print(f"  {i}. {step}")
         sys.exit(0)
     
+    # Imported here so that --list-steps doesn't load the generators
+    from src.pipeline.generator import PipelineGenerator
+    from src.utils.logging import stop_logging
+    
     try:
-        # Validate single step
-        if not PipelineStep.validate_step(args.step):
-            raise ValueError(f"Invalid step specified: {args.step}")
-        
-        generator = PipelineGenerator(args.config)
-        generator.write_scripts(args.output_dir, [args.step])
+        try:
+            generator = PipelineGenerator(args.config)
+            generator.write_scripts(args.output_dir, args.step)
+        finally:
+            # Write out queued log records before printing the outcome
+            stop_logging()
         
         print("\nScript generated successfully!")
         print("To run the pipeline:")
-        step_num = PipelineStep.get_step_number(args.step)
-        print(f"  ./s{step_num:02d}_{args.step}.sh")
+        for step in args.step:
+            print(f"  ./{PipelineStep.filename_for(step)}")
         
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr)
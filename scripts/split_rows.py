@@ -2,49 +2,345 @@
 """
 Split rows in a tab-delimited file where a specified column contains pipe-separated values.
 Treats all data as text to avoid any type conversions.
+
+Uses the compiled kernel from _split_rows.pyx when it has been built alongside
+this script (set SPLIT_ROWS_CYTHON=0 to disable it). Otherwise large files are
+split by a byte scanner compiled with numba when it is installed (set
+SPLIT_ROWS_NUMBA=0 to disable it); small files (and environments without
+numba) use a pure Python block scanner, which avoids paying the numba import
+cost per parallel job.
 """
+import importlib.util
 import sys
 import os
 
+if os.environ.get('SPLIT_ROWS_CYTHON', '1') != '0':
+    try:
+        from _split_rows import split_file
+    except ImportError:
+        split_file = None
+else:
+    split_file = None
+
+# Files smaller than this are split by the block scanner rather than through
+# numba
+NUMBA_MIN_BYTES = 64 * 1024 * 1024
+
+# Block size handed to the numba scanner per call
+NUMBA_BLOCK_BYTES = 16 * 1024 * 1024
+
+# File buffer size, and number of output rows batched per writelines() call
+BUFFER_BYTES = 1 << 20
+WRITE_BATCH_ROWS = 4096
+
+
+def _write_all(fd: int, data: bytearray) -> None:
+    """Write all of data to a file descriptor, retrying short writes."""
+    written = os.write(fd, data)
+    while written < len(data):
+        written += os.write(fd, data[written:])
+
+
+def _split_line(buf: bytes, start: int, end: int, split_col: int, out: bytearray) -> bool:
+    """
+    Append the split rows for the line buf[start:end] (without newline) to out.
+
+    Returns:
+        False if the column doesn't exist or needs no split, in which case
+        nothing is appended
+    """
+    # Skip split_col tabs to find the start of the target column
+    field_start = start
+    for _ in range(split_col):
+        tab = buf.find(b'\t', field_start, end)
+        if tab < 0:
+            return False
+        field_start = tab + 1
+
+    field_end = buf.find(b'\t', field_start, end)
+    if field_end < 0:
+        field_end = end
+
+    if buf.find(b'|', field_start, field_end) < 0:
+        return False
+
+    # The prefix and suffix keep the tabs either side of the split column.
+    # Each sub-value is emitted as soon as its pipe is found, so no list of
+    # tokens is built
+    prefix = buf[start:field_start]
+    suffix = buf[field_end:end]
+    value_start = field_start
+    while True:
+        pipe = buf.find(b'|', value_start, field_end)
+        value_end = field_end if pipe < 0 else pipe
+        out += prefix
+        out += buf[value_start:value_end].strip()
+        out += suffix
+        out += b'\n'
+        if pipe < 0:
+            return True
+        value_start = pipe + 1
+
+
+def split_buffered(input_file: str, output_file: str, split_col: int) -> None:
+    """
+    Split rows by scanning large blocks read with os.read.
+
+    Only lines containing a pipe are visited, located with bytes.find, and no
+    per-line field list is built; runs of other lines are copied through whole.
+    Output is accumulated in a bytearray and flushed with os.write.
+
+    Args:
+        input_file: Path to input file
+        output_file: Path to write split rows to
+        split_col: 0-based column number to split
+    """
+    in_fd = os.open(input_file, os.O_RDONLY)
+    try:
+        out_fd = os.open(output_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            out = bytearray()
+            tail = b''
+            while True:
+                block = os.read(in_fd, BUFFER_BYTES)
+                if not block:
+                    break
+                buf = tail + block if tail else block
+
+                # Only complete lines are processed; the rest carries over.
+                # Jump from pipe to pipe, copying the lines in between whole
+                stop = buf.rfind(b'\n') + 1
+                pos = 0
+                while True:
+                    pipe = buf.find(b'|', pos, stop)
+                    if pipe < 0:
+                        out += buf[pos:stop]
+                        break
+                    line_start = buf.rfind(b'\n', pos, pipe) + 1 or pos
+                    newline = buf.find(b'\n', pipe, stop)
+                    out += buf[pos:line_start]
+                    if not _split_line(buf, line_start, newline, split_col, out):
+                        out += buf[line_start:newline + 1]
+                    pos = newline + 1
+                tail = buf[stop:]
+
+                if len(out) >= BUFFER_BYTES:
+                    _write_all(out_fd, out)
+                    out.clear()
+
+            # A final line without a newline is kept as-is unless it is split
+            if tail and not _split_line(tail, 0, len(tail), split_col, out):
+                out += tail
+            _write_all(out_fd, out)
+        finally:
+            os.close(out_fd)
+    finally:
+        os.close(in_fd)
+
+
+def _scan_and_emit(buf, split_col, out):
+    """
+    Split the lines of a uint8 array on pipes in one column.
+
+    Written in the subset of Python that numba compiles; see split_numba. The
+    size of the output is returned, and out is only written to when it is
+    non-empty, so callers size out with one pass and fill it with a second.
+    A final line without a newline is kept as-is unless it is split.
+
+    Args:
+        buf: Input bytes as a uint8 array
+        split_col: 0-based column number to split
+        out: uint8 array to write split rows to, or an empty array
+
+    Returns:
+        Number of bytes of output
+    """
+    n = buf.shape[0]
+    write = out.shape[0] > 0
+    pos = 0
+    start = 0
+    while start < n:
+        # Find the end of the line and the start of the target column
+        end = start
+        field_start = start
+        tabs = 0
+        while end < n and buf[end] != 10:
+            if buf[end] == 9 and tabs < split_col:
+                tabs += 1
+                field_start = end + 1
+            end += 1
+        line_end = end + 1 if end < n else end
+
+        pipes = 0
+        field_end = field_start
+        if tabs == split_col:
+            while field_end < end and buf[field_end] != 9:
+                if buf[field_end] == 124:
+                    pipes += 1
+                field_end += 1
+
+        # If column doesn't exist or needs no split, copy the original line
+        if pipes == 0:
+            if write:
+                out[pos:pos + line_end - start] = buf[start:line_end]
+            pos += line_end - start
+            start = line_end
+            continue
+
+        # Write prefix, stripped sub-value and suffix for each split value
+        value_start = field_start
+        while value_start <= field_end:
+            value_end = value_start
+            while value_end < field_end and buf[value_end] != 124:
+                value_end += 1
+            next_start = value_end + 1
+
+            while value_start < value_end and (
+                    buf[value_start] == 32 or 9 <= buf[value_start] <= 13):
+                value_start += 1
+            while value_end > value_start and (
+                    buf[value_end - 1] == 32 or 9 <= buf[value_end - 1] <= 13):
+                value_end -= 1
+
+            if write:
+                length = field_start - start
+                out[pos:pos + length] = buf[start:field_start]
+                pos += length
+                length = value_end - value_start
+                out[pos:pos + length] = buf[value_start:value_end]
+                pos += length
+                length = end - field_end
+                out[pos:pos + length] = buf[field_end:end]
+                pos += length
+                out[pos] = 10
+                pos += 1
+            else:
+                pos += (field_start - start) + (value_end - value_start) + (end - field_end) + 1
+            value_start = next_start
+        start = line_end
+    return pos
+
+
+_numba_scan_and_emit = None
+
+
+def split_numba(input_file: str, output_file: str, split_col: int) -> None:
+    """
+    Split rows with _scan_and_emit compiled by numba.
+
+    The compiled scanner is cached next to this script, so only the first run
+    pays the compilation cost. Complete lines are handed to it in large blocks.
+
+    Args:
+        input_file: Path to input file
+        output_file: Path to write split rows to
+        split_col: 0-based column number to split
+    """
+    global _numba_scan_and_emit
+    import numba
+    import numpy as np
+
+    if _numba_scan_and_emit is None:
+        _numba_scan_and_emit = numba.njit(cache=True, boundscheck=False)(_scan_and_emit)
+    empty = np.empty(0, dtype=np.uint8)
+
+    def emit(buf, outfile):
+        data = np.frombuffer(buf, dtype=np.uint8)
+        size = _numba_scan_and_emit(data, split_col, empty)
+        if size:
+            out = np.empty(size, dtype=np.uint8)
+            _numba_scan_and_emit(data, split_col, out)
+            outfile.write(out)
+
+    with open(input_file, 'rb') as infile, open(output_file, 'wb') as outfile:
+        tail = b''
+        while True:
+            block = infile.read(NUMBA_BLOCK_BYTES)
+            if not block:
+                break
+            buf = tail + block if tail else block
+
+            # Only complete lines are processed; the rest carries over
+            stop = buf.rfind(b'\n') + 1
+            if stop:
+                emit(memoryview(buf)[:stop], outfile)
+            tail = buf[stop:]
+
+        if tail:
+            emit(tail, outfile)
+
+
+def split_lines(input_file: str, output_file: str, split_col: int) -> None:
+    """
+    Split rows line-by-line in pure Python.
+
+    This is the straightforward reference for the faster passes. Works on
+    bytes throughout, so lines that need no split are written back without a
+    decode/encode cycle; sub-values are stripped of ASCII whitespace.
+
+    Args:
+        input_file: Path to input file
+        output_file: Path to write split rows to
+        split_col: 0-based column number to split
+    """
+    batch = []
+    with open(input_file, 'rb', buffering=BUFFER_BYTES) as infile, \
+            open(output_file, 'wb', buffering=BUFFER_BYTES) as outfile:
+        for line in infile:
+            if len(batch) >= WRITE_BATCH_ROWS:
+                outfile.writelines(batch)
+                batch.clear()
+
+            fields = line.rstrip(b'\n').split(b'\t')
+
+            # If column doesn't exist, write original line
+            if len(fields) <= split_col:
+                batch.append(line)
+                continue
+
+            # Split the target column on pipes
+            values = fields[split_col].split(b'|')
+
+            # If no split needed, write original line
+            if len(values) <= 1:
+                batch.append(line)
+                continue
+
+            # Join the unchanged columns once, keeping the tabs either side
+            # of the split column, then create new row for each split value
+            prefix = b'\t'.join(fields[:split_col] + [b''])
+            suffix = b'\t'.join([b''] + fields[split_col + 1:])
+            for value in values:
+                batch.append(prefix + value.strip() + suffix + b'\n')
+
+        outfile.writelines(batch)
+
+
 def process_file(input_file: str, split_col: int) -> None:
     """
     Split rows where specified column contains pipe-separated values.
-    
+
     Args:
         input_file: Path to input file
         split_col: 1-based column number to split (converting to 0-based internally)
     """
     if not os.path.exists(input_file):
         raise FileNotFoundError(f"Input file not found: {input_file}")
-        
+
     # Convert to 0-based indexing for internal use
     split_col = split_col - 1
     output_file = f"{input_file}.split"
-    
+
     try:
-        with open(input_file, 'r') as infile, open(output_file, 'w') as outfile:
-            for line in infile:
-                fields = line.strip('\n').split('\t')
-                
-                # If column doesn't exist, write original line
-                if len(fields) <= split_col:
-                    outfile.write(line)
-                    continue
-                    
-                # Split the target column on pipes
-                values = fields[split_col].split('|')
-                
-                # If no split needed, write original line
-                if len(values) <= 1:
-                    outfile.write(line)
-                    continue
-                    
-                # Create new row for each split value
-                for value in values:
-                    new_row = fields.copy()
-                    new_row[split_col] = value.strip()
-                    outfile.write('\t'.join(new_row) + '\n')
-                    
+        if split_file is not None:
+            split_file(input_file, output_file, split_col)
+        elif (os.path.getsize(input_file) >= NUMBA_MIN_BYTES
+                and os.environ.get('SPLIT_ROWS_NUMBA', '1') != '0'
+                and importlib.util.find_spec('numba') is not None):
+            split_numba(input_file, output_file, split_col)
+        else:
+            split_buffered(input_file, output_file, split_col)
+
     except Exception as e:
         # Clean up partial output file on error
         if os.path.exists(output_file):
@@ -1,8 +1,10 @@
 from dataclasses import dataclass
 from typing import Dict
 
-@dataclass
+@dataclass(frozen=True)
 class GridEngineConfig:
+    __slots__ = ('cpus', 'memory', 'runtime')
+
     cpus: int
     memory: str
     runtime: str
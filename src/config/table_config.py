@@ -1,9 +1,16 @@
 from dataclasses import dataclass
-from typing import Dict, List, Optional
+from typing import Any, DefaultDict, Dict, List, Optional
 from collections import defaultdict
 
-@dataclass
+@dataclass(frozen=True)
 class TableConfig:
+    # _columns_to_codelists is derived from codelist_annotations on first use
+    __slots__ = (
+        'name', 'subfolder_pattern', 'file_pattern', 'file_path', 'date_columns',
+        'lookup_columns', 'codelist_annotations', 'additional_files',
+        '_columns_to_codelists'
+    )
+
     name: str
     subfolder_pattern: str
     file_pattern: str
@@ -14,20 +21,25 @@ class TableConfig:
     additional_files: Dict[str, str]
 
     @classmethod
-    def from_dict(cls, name: str, config: Dict) -> 'TableConfig':
-        """Create TableConfig from dict."""
+    def from_dict(cls, name: str, config: Dict[str, Any]) -> 'TableConfig':
+        """
+        Create TableConfig from dict.
+        
+        Keys that are missing or left empty in the YAML (and so parse as None)
+        get empty defaults, so every field can be tested for truthiness.
+        """
         return cls(
             name=name,
-            subfolder_pattern=config.get('subfolder_pattern', ''),
-            file_pattern=config.get('file_pattern', ''),
+            subfolder_pattern=config.get('subfolder_pattern') or '',
+            file_pattern=config.get('file_pattern') or '',
             file_path=config.get('file_path'),
-            date_columns=config.get('date_columns', []),
-            lookup_columns=config.get('lookup_columns', {}),
-            codelist_annotations=config.get('codelist_annotations', {}),
-            additional_files=config.get('additional_files', {})
+            date_columns=config.get('date_columns') or [],
+            lookup_columns=config.get('lookup_columns') or {},
+            codelist_annotations=config.get('codelist_annotations') or {},
+            additional_files=config.get('additional_files') or {}
         )
 
-    def validate(self):
+    def validate(self) -> None:
         """Validate table configuration."""
         if not self.name:
             raise ValueError("Table name cannot be empty")
@@ -43,10 +55,18 @@ class TableConfig:
         """
         Get a mapping of columns to their associated codelists.
         
+        Computed once per instance; the returned mapping should not be modified.
+        
         Returns:
             Dictionary mapping column names to lists of codelist names that annotate them
         """
-        column_to_codelists = defaultdict(list)
-        for codelist_name, column in self.codelist_annotations.items():
-            column_to_codelists[column].append(codelist_name)
-        return dict(column_to_codelists)
\ No newline at end of file
+        columns_to_codelists: Optional[Dict[str, List[str]]] = getattr(
+            self, '_columns_to_codelists', None
+        )
+        if columns_to_codelists is None:
+            column_to_codelists: DefaultDict[str, List[str]] = defaultdict(list)
+            for codelist_name, column in self.codelist_annotations.items():
+                column_to_codelists[column].append(codelist_name)
+            columns_to_codelists = dict(column_to_codelists)
+            object.__setattr__(self, '_columns_to_codelists', columns_to_codelists)
+        return columns_to_codelists
\ No newline at end of file
@@ -1,5 +1,6 @@
 from dataclasses import dataclass
-from typing import Dict, Any, List, Optional, Set
+from typing import Dict, Any, List, Optional, Tuple
+import errno
 import os
 import logging
 import shutil
@@ -9,26 +10,46 @@ from src.generators.base import BaseGenerator
 from src.generators.exceptions import InputValidationError, FileNotFoundError, ConfigurationError
 from src.config.table_config import TableConfig
 from src.config.grid_engine import GridEngineConfig
+from src.utils.dir_cache import scandir_cached
+from src.utils.headers import read_header
 from src.utils.table_validator import TableValidator
+from src.utils.paths import expand_path
+from src.utils.parallel import map_maybe_parallel
+
+# Row-splitting helper installed alongside the generated annotation script
+_SPLIT_ROWS_SRC = Path(__file__).resolve().parent.parent.parent / 'scripts' / 'split_rows.py'
+if not _SPLIT_ROWS_SRC.is_file():
+    raise FileNotFoundError(
+        f"Required script not found: {_SPLIT_ROWS_SRC}\n"
+        "Please ensure split_rows.py is present in the scripts directory."
+    )
+
+# Configuration keys this step requires
+REQUIRED_KEYS = frozenset({'tables', 'processed_data_folder', 'grid_engine', 'codelists'})
 
 class CodelistAnnotationGenerator(BaseGenerator):
     """Generator for annotating tables with codelist descriptions and flags."""
 
-    def __init__(self, logger=None):
+    def __init__(self, logger: Optional[logging.Logger] = None) -> None:
         super().__init__(
             template_name='annotate_tables',
             logger=logger or logging.getLogger(__name__)
         )
         self.validator = TableValidator(self.logger)
-        self.tables_to_process = []
-        self.table_configs = {}
-        self.scripts_dir = None
+        self.tables_to_process: List[str] = []
+        self.table_configs: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self.scripts_dir: str = ''
+        self.processed_data_folder: str = ''
+        self.tables: Dict[str, TableConfig] = {}
+        # Codelist formats by path, so shared codelists are only read once
+        self._format_cache: Dict[str, Dict[str, Any]] = {}
         # Add dictionary to track input files for each table
-        self.table_input_files = {}
+        self.table_input_files: Dict[str, str] = {}
 
     def get_codelist_format(self, file_path: str) -> Dict[str, Any]:
         """
         Determine the format of a codelist file by reading its header.
+        Results are cached per path for the current validation run.
         
         Args:
             file_path: Path to the codelist file
@@ -39,20 +60,34 @@ class CodelistAnnotationGenerator(BaseGenerator):
                 - has_count: Whether file has count column
                 - has_flag: Whether file has flag column
                 - headers: List of column headers
+                
+        Raises:
+            FileNotFoundError: If the codelist file doesn't exist
+            ConfigurationError: If the codelist can't be read
         """
+        if file_path in self._format_cache:
+            return self._format_cache[file_path]
+
         try:
-            with open(file_path, 'r') as f:
-                header = f.readline().strip().split('\t')
+            header = read_header(file_path)
                 
-            return {
+            format_info = {
                 'column_count': len(header),
                 'has_count': len(header) == 4,  # Only true for 4-column format
                 'has_flag': len(header) == 4,   # Only true for 4-column format
                 'headers': header
             }
         except Exception as e:
+            if isinstance(e, OSError) and e.errno == errno.ENOENT:
+                raise FileNotFoundError(
+                    f"Codelist file not found: {file_path}\n"
+                    f"Has the prepare_codelists step been run?"
+                )
             raise ConfigurationError(f"Error reading codelist {file_path}: {str(e)}")
 
+        self._format_cache[file_path] = format_info
+        return format_info
+
     def find_latest_input_file(
         self,
         table_name: str,
@@ -71,19 +106,22 @@ class CodelistAnnotationGenerator(BaseGenerator):
         Raises:
             FileNotFoundError: If no input file is found
         """
-        expanded_folder = os.path.expandvars(processed_data_folder)
+        expanded_folder = expand_path(processed_data_folder)
         table_dir = os.path.join(expanded_folder, table_name)
         
+        # List the directory once rather than probing each candidate file
+        try:
+            entries = {entry.name for entry in scandir_cached(table_dir)}
+        except OSError:
+            entries = set()
+        
         # Check files in order of preference: s03 -> s02 -> s01
         for step in ['s03', 's02', 's01']:
-            file_path = os.path.join(
-                table_dir,
-                f"{step}_{table_name}.txt"
-            )
-            if os.path.exists(file_path):
+            filename = f"{step}_{table_name}.txt"
+            if filename in entries:
                 # Store just the filename part, not the full path
-                self.table_input_files[table_name] = f"{step}_{table_name}.txt"
-                return file_path
+                self.table_input_files[table_name] = filename
+                return os.path.join(table_dir, filename)
         
         raise FileNotFoundError(
             f"No input file found for table {table_name}.\n"
@@ -105,8 +143,7 @@ class CodelistAnnotationGenerator(BaseGenerator):
                 "Please ensure you have declared your codelists under a 'codelists' key."
             )
         
-        declared_codelists = set(config['codelists'].keys())
-        missing_refs = []
+        declared_codelists = frozenset(config['codelists'])
         
         # Only check tables that have codelist annotations
         tables_with_codelists = {
@@ -114,23 +151,89 @@ class CodelistAnnotationGenerator(BaseGenerator):
             if table.codelist_annotations
         }
         
-        for table_name, table in tables_with_codelists.items():
-            for codelist_name in table.codelist_annotations.keys():
-                if codelist_name not in declared_codelists:
-                    column = table.codelist_annotations[codelist_name]
-                    missing_refs.append(
-                        f"Table '{table_name}' uses undeclared codelist '{codelist_name}' "
-                        f"for column '{column}'"
-                    )
+        # Nothing to report if every referenced codelist is declared
+        referenced_codelists = {
+            codelist_name
+            for table in tables_with_codelists.values()
+            for codelist_name in table.codelist_annotations
+        }
+        if referenced_codelists <= declared_codelists:
+            return
         
-        if missing_refs:
-            error_msg = ["Missing codelist references:"]
-            error_msg.extend(missing_refs)
-            error_msg.extend([
-                "\nDeclared codelists are:",
-                *[f"- {codelist}" for codelist in sorted(declared_codelists)]
-            ])
-            raise ConfigurationError("\n".join(error_msg))
+        missing_refs = [
+            f"Table '{table_name}' uses undeclared codelist '{codelist_name}' "
+            f"for column '{column}'"
+            for table_name, table in tables_with_codelists.items()
+            for codelist_name, column in table.codelist_annotations.items()
+            if codelist_name not in declared_codelists
+        ]
+        
+        error_msg = ["Missing codelist references:"]
+        error_msg.extend(missing_refs)
+        error_msg.extend([
+            "\nDeclared codelists are:",
+            *[f"- {codelist}" for codelist in sorted(declared_codelists)]
+        ])
+        raise ConfigurationError("\n".join(error_msg))
+
+    def validate_table_codelists(
+        self,
+        table_name: str,
+        table: TableConfig,
+        scripts_dir: str,
+        config: Dict[str, Any]
+    ) -> Dict[str, Dict[str, Any]]:
+        """Validate codelist files for one table and get its column configurations."""
+        try:
+            input_file = self.find_latest_input_file(
+                table_name,
+                config['processed_data_folder']
+            )
+
+            columns_to_codelists = table.get_columns_to_codelists()
+            positions = self.validator.validate_columns(
+                input_file,
+                list(columns_to_codelists.keys()),
+                table_name
+            )
+
+            column_configs: Dict[str, Dict[str, Any]] = {}
+            for column, codelist_names in columns_to_codelists.items():
+                codelist_files: List[Dict[str, Any]] = []
+                for codelist_name in codelist_names:
+                    codelist_path = os.path.join(
+                        scripts_dir,
+                        "lists",
+                        f"{codelist_name}_terms.txt"
+                    )
+
+                    # Get format information for this codelist, which also
+                    # checks that it exists
+                    format_info = self.get_codelist_format(codelist_path)
+                    
+                    if format_info['column_count'] not in [2, 4]:
+                        raise ConfigurationError(
+                            f"Invalid codelist format in {codelist_path}. "
+                            f"Expected 2 columns (code, description) or "
+                            f"4 columns (code, description, count, flag). "
+                            f"Found {format_info['column_count']} columns."
+                        )
+
+                    codelist_files.append({
+                        'name': codelist_name,
+                        'path': codelist_path,
+                        'format': format_info
+                    })
+
+                column_configs[column] = {
+                    'position': positions[column],
+                    'codelists': codelist_files
+                }
+
+            return column_configs
+
+        except (FileNotFoundError, ValueError) as e:
+            raise InputValidationError(f"Error validating {table_name}: {str(e)}")
 
     def validate_codelist_files(
         self,
@@ -138,98 +241,54 @@ class CodelistAnnotationGenerator(BaseGenerator):
         scripts_dir: str,
         config: Dict[str, Any]
     ) -> Dict[str, Dict[str, Dict[str, Any]]]:
-        """Validate codelist files and get their configurations."""
-        table_configs = {}
+        """
+        Validate codelist files and get their configurations.
+        
+        Tables are validated through map_maybe_parallel. Worker threads only
+        make single-key dict updates to the shared caches, so a race at worst
+        repeats a read.
+        """
+        self._format_cache.clear()
 
         tables_with_codelists = {
             name: table for name, table in tables.items() 
             if table.codelist_annotations
         }
 
-        for table_name, table in tables_with_codelists.items():
-            try:
-                input_file = self.find_latest_input_file(
-                    table_name,
-                    config['processed_data_folder']
-                )
+        def validate_table(
+            item: Tuple[str, TableConfig]
+        ) -> Tuple[str, Dict[str, Dict[str, Any]]]:
+            table_name, table = item
+            return table_name, self.validate_table_codelists(
+                table_name, table, scripts_dir, config
+            )
 
-                columns_to_codelists = table.get_columns_to_codelists()
-                positions = self.validator.validate_columns(
-                    input_file,
-                    list(columns_to_codelists.keys()),
-                    table_name
-                )
+        # Results are collected in table order, so errors match a serial run
+        results = map_maybe_parallel(validate_table, tables_with_codelists.items())
 
-                column_configs = {}
-                for column, codelist_names in columns_to_codelists.items():
-                    codelist_files = []
-                    for codelist_name in codelist_names:
-                        codelist_path = os.path.join(
-                            scripts_dir,
-                            "lists",
-                            f"{codelist_name}_terms.txt"
-                        )
+        return dict(results)
 
-                        if not os.path.exists(codelist_path):
-                            raise FileNotFoundError(
-                                f"Codelist file not found: {codelist_path}\n"
-                                f"Has the prepare_codelists step been run?"
-                            )
-
-                        # Get format information for this codelist
-                        format_info = self.get_codelist_format(codelist_path)
-                        
-                        if format_info['column_count'] not in [2, 4]:
-                            raise ConfigurationError(
-                                f"Invalid codelist format in {codelist_path}. "
-                                f"Expected 2 columns (code, description) or "
-                                f"4 columns (code, description, count, flag). "
-                                f"Found {format_info['column_count']} columns."
-                            )
-
-                        codelist_files.append({
-                            'name': codelist_name,
-                            'path': codelist_path,
-                            'format': format_info
-                        })
-
-                    column_configs[column] = {
-                        'position': positions[column],
-                        'codelists': codelist_files
-                    }
-
-                table_configs[table_name] = column_configs
-
-            except (FileNotFoundError, ValueError) as e:
-                raise InputValidationError(f"Error validating {table_name}: {str(e)}")
-
-        return table_configs
-
-    def validate_inputs(self, config: Dict[str, Any]):
+    def validate_inputs(self, config: Dict[str, Any]) -> None:
         """Validate all required inputs are present and valid."""
-        required_keys = ['tables', 'processed_data_folder', 'grid_engine', 'codelists']
-        missing_keys = [key for key in required_keys if key not in config]
+        missing_keys = sorted(REQUIRED_KEYS - config.keys())
         if missing_keys:
             raise InputValidationError(f"Missing required configuration keys: {missing_keys}")
 
         # Validate output directory exists
-        processed_data_folder = os.path.expandvars(config['processed_data_folder'])
+        processed_data_folder = expand_path(config['processed_data_folder'])
         if not os.path.isdir(processed_data_folder):
             raise InputValidationError(
                 f"Output directory does not exist: {processed_data_folder}"
             )
 
         # Initialize tables
-        tables = {
-            name: TableConfig.from_dict(name, table_config)
-            for name, table_config in config['tables'].items()
-        }
+        tables = self._build_tables(config)
         
         # Validate codelist references against configuration
         self.validate_codelist_references(tables, config)
 
         # Get scripts directory
-        scripts_dir = os.path.expandvars(config['script_output_dir'])
+        scripts_dir = expand_path(config['script_output_dir'])
         
         # Validate codelist files and get configurations
         self.table_configs = self.validate_codelist_files(
@@ -250,50 +309,94 @@ class CodelistAnnotationGenerator(BaseGenerator):
         # Only process tables that have codelist configurations
         self.tables_to_process = list(self.table_configs.keys())
         self.scripts_dir = scripts_dir
+        self.processed_data_folder = processed_data_folder
+        self.tables = tables
 
     def create_filelist(self) -> str:
         """Create filelist for array job processing."""
         filelist_path = os.path.join(self.scripts_dir, "s05_annotation_filelist.txt")
         with open(filelist_path, 'w') as f:
-            for table in self.tables_to_process:
-                f.write(f"{table}\n")
+            # One line per table, written in a single call
+            if self.tables_to_process:
+                f.write("\n".join(self.tables_to_process) + "\n")
         return filelist_path
 
+    def install_script(self, source: str, dest: str) -> None:
+        """
+        Install a helper script into the scripts directory.
+
+        The script is hard linked rather than copied, so installing it is
+        O(1) and the installed copy follows later edits to the source. Falls
+        back to copying when the scripts directory is on another filesystem,
+        and is skipped when the script is already installed.
+
+        Args:
+            source: Path to the script in the repository
+            dest: Path to install the script at
+        """
+        # Nothing to do if dest is already this file, or an up to date copy
+        try:
+            source_stat = os.stat(source)
+            dest_stat = os.stat(dest)
+        except OSError:
+            pass
+        else:
+            if dest_stat.st_mode & 0o755 == 0o755 and (
+                os.path.samestat(source_stat, dest_stat)
+                or (source_stat.st_size == dest_stat.st_size
+                    and int(source_stat.st_mtime) == int(dest_stat.st_mtime))
+            ):
+                return
+
+        try:
+            os.unlink(dest)
+        except OSError as e:
+            if e.errno != errno.ENOENT:
+                raise
+
+        try:
+            os.link(source, dest)
+        except OSError as e:
+            if e.errno != errno.EXDEV:
+                raise
+            shutil.copy2(source, dest)
+
+        # A link shares the source's mode, so this only applies to copies of
+        # a source that is not already executable
+        if os.stat(dest).st_mode & 0o755 != 0o755:
+            os.chmod(dest, 0o755)
+
     def generate(self, config: Dict[str, Any]) -> str:
         """Generate codelist annotation script."""
         self.validate_inputs(config)
         
-        # Initialize configurations
-        tables = {
-            name: TableConfig.from_dict(name, table_config)
-            for name, table_config in config['tables'].items()
-        }
+        # Reuse the table configurations built during validation
+        tables = self.tables
         
         grid_engine = GridEngineConfig.from_dict(config['grid_engine'])
         grid_engine.validate()
         
-        # Get output directories
-        processed_data_folder = os.path.expandvars(config['processed_data_folder'])
+        # Output directories were expanded during validation
+        processed_data_folder = self.processed_data_folder
         
-        # Ensure directories exist
-        os.makedirs(processed_data_folder, exist_ok=True)
+        # Ensure the scripts directory exists; validate_inputs has already
+        # checked that the processed data folder does
         os.makedirs(self.scripts_dir, exist_ok=True)
         
         # Create filelist
         filelist_path = self.create_filelist()
         
-        # Copy split_rows.py script
-        script_source = Path(__file__).parent.parent.parent / 'scripts' / 'split_rows.py'
-        if not script_source.exists():
-            raise FileNotFoundError(
-                f"Required script not found: {script_source}\n"
-                "Please ensure split_rows.py is present in the scripts directory."
-            )
-            
+        # Install split_rows.py script
         script_dest = os.path.join(self.scripts_dir, 'split_rows.py')
-        shutil.copy2(script_source, script_dest)
-        os.chmod(script_dest, 0o755)
-        
+        self.install_script(str(_SPLIT_ROWS_SRC), script_dest)
+
+        # Install the compiled split kernel alongside it, if it has been built
+        for extension in _SPLIT_ROWS_SRC.parent.glob('_split_rows*.so'):
+            self.install_script(
+                str(extension),
+                os.path.join(self.scripts_dir, extension.name)
+            )
+
         # Generate script using template
         return self._render_template(
             tables=tables,
@@ -1,26 +1,52 @@
 from abc import ABC, abstractmethod
-from typing import Dict, Any
-import jinja2
+from typing import TYPE_CHECKING, Dict, Any
+import functools
 import logging
 from pathlib import Path
 
+from src.config.table_config import TableConfig
+
+if TYPE_CHECKING:
+    import jinja2
+
+TEMPLATE_DIR = str(Path(__file__).parent.parent.parent / 'templates')
+
+# Config key holding TableConfig objects prebuilt from the 'tables' section
+TABLES_OBJ_KEY = '_tables_obj'
+
+@functools.lru_cache(maxsize=None)
+def _template_environment(template_dir: str) -> 'jinja2.Environment':
+    """Get the Jinja2 environment for a template directory, shared by all generators."""
+    # Imported here so that validating inputs doesn't load Jinja2
+    import jinja2
+
+    return jinja2.Environment(
+        loader=jinja2.FileSystemLoader(template_dir),
+        trim_blocks=True,
+        lstrip_blocks=True,
+        cache_size=-1,
+        auto_reload=False
+    )
+
 class BaseGenerator(ABC):
-    def __init__(self, template_name: str, logger: logging.Logger):
+    # Compiled templates by template name, shared across instances
+    _TEMPLATE_CACHE: Dict[str, 'jinja2.Template'] = {}
+
+    def __init__(self, template_name: str, logger: logging.Logger) -> None:
         self.template_name = template_name
         self.logger = logger
-        self.template_env = self._setup_template_environment()
 
-    def _setup_template_environment(self) -> jinja2.Environment:
+    @property
+    def template_env(self) -> 'jinja2.Environment':
+        """Jinja2 template environment, set up on first use."""
+        return self._setup_template_environment()
+
+    def _setup_template_environment(self) -> 'jinja2.Environment':
         """Setup Jinja2 template environment."""
-        template_dir = Path(__file__).parent.parent.parent / 'templates'
-        return jinja2.Environment(
-            loader=jinja2.FileSystemLoader(str(template_dir)),
-            trim_blocks=True,
-            lstrip_blocks=True
-        )
+        return _template_environment(TEMPLATE_DIR)
 
     @abstractmethod
-    def validate_inputs(self, config: Dict[str, Any]):
+    def validate_inputs(self, config: Dict[str, Any]) -> None:
         """Validate inputs required for this generator."""
         pass
 
@@ -29,7 +55,25 @@ class BaseGenerator(ABC):
         """Generate the script content."""
         pass
 
-    def _render_template(self, **kwargs) -> str:
+    def _build_tables(self, config: Dict[str, Any]) -> Dict[str, TableConfig]:
+        """
+        Build table configurations from the 'tables' section of the config.
+        
+        Uses the configurations prebuilt by the pipeline under TABLES_OBJ_KEY
+        when present, so they are only built once for all steps.
+        """
+        prebuilt = config.get(TABLES_OBJ_KEY)
+        if prebuilt is not None:
+            return dict(prebuilt)
+        return {
+            name: TableConfig.from_dict(name, table_config)
+            for name, table_config in config['tables'].items()
+        }
+
+    def _render_template(self, **kwargs: Any) -> str:
         """Render the template with provided arguments."""
-        template = self.template_env.get_template(f"{self.template_name}.sh.j2")
+        template = self._TEMPLATE_CACHE.get(self.template_name)
+        if template is None:
+            template = self.template_env.get_template(f"{self.template_name}.sh.j2")
+            self._TEMPLATE_CACHE[self.template_name] = template
         return template.render(**kwargs)
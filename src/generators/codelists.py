@@ -1,11 +1,17 @@
-from dataclasses import dataclass
-from typing import Dict, Any, List, Optional, Set
+from dataclasses import dataclass, field
+from typing import Dict, Any, List, Optional
+import errno
 import os
 import logging
-from pathlib import Path
 
 from src.generators.base import BaseGenerator
 from src.generators.exceptions import InputValidationError, FileNotFoundError, ConfigurationError
+from src.utils.headers import read_header_line
+from src.utils.paths import expand_path
+from src.utils.parallel import map_maybe_parallel
+
+# Configuration keys this step requires
+REQUIRED_KEYS = frozenset({'codelists', 'codelists_folder', 'script_output_dir', 'grid_engine'})
 
 @dataclass
 class CodelistConfig:
@@ -13,6 +19,19 @@ class CodelistConfig:
     id: str
     original: Optional[str]
     user: Optional[str]
+    # Which of the three cases this codelist represents, set on construction
+    _type: str = field(default='', init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        if self.original and not self.user:
+            self._type = 'original_only'
+        elif self.user and not self.original:
+            self._type = 'user_only'
+        elif self.original and self.user:
+            self._type = 'combined'
+        else:
+            raise ConfigurationError(f"Invalid codelist configuration for {self.id}: "
+                                   "Must specify at least original or user codelist")
     
     @classmethod
     def from_dict(cls, id: str, config: Dict) -> 'CodelistConfig':
@@ -24,15 +43,7 @@ class CodelistConfig:
     
     def get_type(self) -> str:
         """Determine which of the three cases this codelist represents."""
-        if self.original and not self.user:
-            return 'original_only'
-        elif self.user and not self.original:
-            return 'user_only'
-        elif self.original and self.user:
-            return 'combined'
-        else:
-            raise ConfigurationError(f"Invalid codelist configuration for {self.id}: "
-                                   "Must specify at least original or user codelist")
+        return self._type
 
 class CodelistGenerator(BaseGenerator):
     """Generator for preparing reference codelists with enhanced column handling."""
@@ -45,13 +56,12 @@ class CodelistGenerator(BaseGenerator):
         
     def validate_inputs(self, config: Dict[str, Any]):
         """Validate all required inputs are present and valid."""
-        required_keys = ['codelists', 'codelists_folder', 'script_output_dir', 'grid_engine']
-        missing_keys = [key for key in required_keys if key not in config]
+        missing_keys = sorted(REQUIRED_KEYS - config.keys())
         if missing_keys:
             raise InputValidationError(f"Missing required configuration keys: {missing_keys}")
 
         # Validate directories exist
-        codelists_folder = os.path.expandvars(config['codelists_folder'])
+        codelists_folder = expand_path(config['codelists_folder'])
         if not os.path.isdir(codelists_folder):
             raise InputValidationError(
                 f"Codelists directory does not exist: {codelists_folder}"
@@ -77,70 +87,105 @@ class CodelistGenerator(BaseGenerator):
             List of column headers
             
         Raises:
+            FileNotFoundError: If the file doesn't exist
             ConfigurationError: If file format is invalid
         """
         try:
-            with open(file_path, 'r') as f:
-                header = f.readline().strip().split('\t')
+            header = read_header_line(file_path)
                 
-            if len(header) < min_columns:
+            # Count columns from the tabs, only splitting a valid header
+            column_count = header.count('\t') + 1
+            if column_count < min_columns:
                 raise ConfigurationError(
                     f"Insufficient columns in {os.path.basename(file_path)}: "
-                    f"found {len(header)}, expected at least {min_columns}"
+                    f"found {column_count}, expected at least {min_columns}"
                 )
             
-            return header
+            return header.split('\t')
             
         except Exception as e:
+            if isinstance(e, OSError) and e.errno == errno.ENOENT:
+                raise FileNotFoundError(f"File not found: {file_path}")
             raise ConfigurationError(
                 f"Error reading {os.path.basename(file_path)}: {str(e)}"
             )
 
-    def validate_codelist_files(self, codelists_folder: str):
+    def validate_codelist(
+        self,
+        codelist_id: str,
+        config: CodelistConfig,
+        codelists_folder: str
+    ) -> List[str]:
         """
-        Validate all codelist files exist and have correct formats.
+        Validate the files of one codelist exist and have correct formats.
         
         Args:
+            codelist_id: Name of the codelist
+            config: Configuration of the codelist
             codelists_folder: Directory containing codelist files
             
+        Returns:
+            Descriptions of the codelist's files that don't exist
+            
         Raises:
-            FileNotFoundError: If required files don't exist
             ConfigurationError: If file format is invalid
         """
         missing_files = []
         
-        for codelist_id, config in self.codelists.items():
-            codelist_type = config.get_type()
-            
-            if codelist_type in ['original_only', 'combined']:
-                if not os.path.isfile(os.path.join(codelists_folder, config.original)):
-                    missing_files.append(
-                        f"- {config.original} (original codelist for {codelist_id})"
-                    )
-                else:
-                    # Validate original codelist has at least code and description
-                    self.validate_file_format(
-                        os.path.join(codelists_folder, config.original),
-                        min_columns=2
-                    )
-            
-            if codelist_type in ['user_only', 'combined']:
-                if not os.path.isfile(os.path.join(codelists_folder, config.user)):
-                    missing_files.append(
-                        f"- {config.user} (user codelist for {codelist_id})"
-                    )
-                else:
-                    # Validate user codelist has 2-3 columns
-                    headers = self.validate_file_format(
-                        os.path.join(codelists_folder, config.user),
-                        min_columns=2
+        # Files are opened directly, and reported missing if that fails
+        if config.original:
+            try:
+                # Validate original codelist has at least code and description
+                self.validate_file_format(
+                    os.path.join(codelists_folder, config.original),
+                    min_columns=2
+                )
+            except FileNotFoundError:
+                missing_files.append(
+                    f"- {config.original} (original codelist for {codelist_id})"
+                )
+        
+        if config.user:
+            try:
+                # Validate user codelist has 2-3 columns
+                headers = self.validate_file_format(
+                    os.path.join(codelists_folder, config.user),
+                    min_columns=2
+                )
+            except FileNotFoundError:
+                missing_files.append(
+                    f"- {config.user} (user codelist for {codelist_id})"
+                )
+            else:
+                if len(headers) > 3:
+                    raise ConfigurationError(
+                        f"Too many columns in {config.user}: "
+                        f"found {len(headers)}, expected 2-3"
                     )
-                    if len(headers) > 3:
-                        raise ConfigurationError(
-                            f"Too many columns in {config.user}: "
-                            f"found {len(headers)}, expected 2-3"
-                        )
         
+        return missing_files
+
+    def validate_codelist_files(self, codelists_folder: str):
+        """
+        Validate all codelist files exist and have correct formats.
+        
+        Codelists are checked through map_maybe_parallel.
+        
+        Args:
+            codelists_folder: Directory containing codelist files
+            
+        Raises:
+            FileNotFoundError: If required files don't exist
+            ConfigurationError: If file format is invalid
+        """
+        def validate(item):
+            codelist_id, config = item
+            return self.validate_codelist(codelist_id, config, codelists_folder)
+
+        # Results are collected in codelist order, so errors match a serial run
+        results = map_maybe_parallel(validate, self.codelists.items())
+
+        missing_files = [missing for result in results for missing in result]
         if missing_files:
             raise FileNotFoundError(
                 "Required codelist files not found:\n" + "\n".join(missing_files)
@@ -1,13 +1,150 @@
 import os
-import glob
-from pathlib import Path
-from typing import Dict, Any, List
+import re
+import fnmatch
+from typing import Dict, Any, Callable, List, NamedTuple, Optional, Tuple
 import logging
 
 from src.generators.base import BaseGenerator
 from src.generators.exceptions import InputValidationError, FileNotFoundError
 from src.config.table_config import TableConfig
 from src.config.grid_engine import GridEngineConfig
+from src.utils.dir_cache import scandir_cached
+from src.utils.parallel import map_maybe_parallel
+
+# Characters that make a glob pattern component a wildcard
+_MAGIC_CHARS = ('*', '?', '[')
+
+# Configuration keys this step requires
+REQUIRED_KEYS = frozenset({'raw_data', 'tables', 'processed_data_folder', 'grid_engine'})
+
+class _RecordBuffer(logging.Handler):
+    """Logging handler that keeps its records, to be handled later in order."""
+    
+    def __init__(self):
+        super().__init__()
+        self.records: List[logging.LogRecord] = []
+    
+    def emit(self, record: logging.LogRecord) -> None:
+        self.records.append(record)
+
+def _buffered_logger(logger: logging.Logger) -> Tuple[logging.Logger, _RecordBuffer]:
+    """
+    Create a logger that buffers records at the level logger is enabled for.
+    
+    The buffered logger isn't part of the logger hierarchy, so its records
+    only reach logger's handlers once they are passed to logger.handle.
+    
+    Args:
+        logger: Logger the buffered records are meant for
+        
+    Returns:
+        Tuple of the buffered logger and the handler holding its records
+    """
+    buffered = logging.Logger(logger.name, logger.getEffectiveLevel())
+    buffer = _RecordBuffer()
+    buffered.addHandler(buffer)
+    return buffered, buffer
+
+def _split_static_prefix(pattern: str) -> Tuple[str, str]:
+    """
+    Split a glob pattern into its leading literal components and the rest.
+    
+    Args:
+        pattern: Glob pattern
+        
+    Returns:
+        Tuple of the literal prefix and the remaining pattern, which starts
+        at the first component containing a wildcard; the prefix of an
+        absolute pattern keeps its leading separator
+    """
+    anchor = os.sep if os.path.isabs(pattern) else ''
+    components = [component for component in pattern.split(os.sep) if component]
+    for i, component in enumerate(components):
+        if any(char in component for char in _MAGIC_CHARS):
+            return anchor + os.sep.join(components[:i]), os.sep.join(components[i:])
+    return anchor + os.sep.join(components), ''
+
+class _GlobPattern(NamedTuple):
+    """Glob pattern split up for _scandir_match, with its wildcards compiled."""
+    base: str
+    components: Tuple[Tuple[str, Optional[Callable[[str], Any]]], ...]
+
+def _compile_glob(pattern: str) -> _GlobPattern:
+    """
+    Split a glob pattern for _scandir_match and compile its wildcard components.
+    
+    Each wildcard component is compiled to the same case-sensitive regex as
+    fnmatch.fnmatchcase uses, so a pattern compiled once can be matched in
+    any number of directories without translating or looking it up again.
+    
+    Args:
+        pattern: Glob pattern
+        
+    Returns:
+        The pattern's literal prefix, and its remaining components each paired
+        with a name matcher, or None for a literal component
+    """
+    base, remainder = _split_static_prefix(pattern)
+    components = remainder.split(os.sep) if remainder else []
+    return _GlobPattern(base, tuple(
+        (component, re.compile(fnmatch.translate(component)).match
+         if any(char in component for char in _MAGIC_CHARS) else None)
+        for component in components
+    ))
+
+def _scandir_match(root: str, pattern: _GlobPattern) -> List[str]:
+    """
+    Find paths under root matching a glob pattern, as glob.glob would.
+    
+    Each directory on the way is listed with scandir_cached, so it is only
+    read again once it has changed, and its entries filtered by the wildcard
+    components' precompiled matchers, using the file type from the listing
+    rather than stat'ing every candidate. As with glob, hidden entries only match pattern
+    components that start with '.'. Literal components are joined on
+    directly, so a fully literal pattern costs a single stat and only
+    directories that a wildcard has to be matched in are listed.
+    
+    Args:
+        root: Directory to match the pattern from
+        pattern: Glob pattern relative to root, compiled by _compile_glob
+        
+    Returns:
+        Matching paths, in no particular order
+    """
+    start = os.path.join(root, pattern.base) if pattern.base else root
+    if not pattern.components:
+        return [start] if os.path.lexists(start) else []
+    
+    paths = [start]
+    last = len(pattern.components) - 1
+    for i, (component, match) in enumerate(pattern.components):
+        # Every component but the last must match a directory
+        need_dir = i < last
+        matches = []
+        if match is None:
+            # Literal components after a wildcard only need a stat per path
+            exists = os.path.isdir if need_dir else os.path.lexists
+            for directory in paths:
+                path = os.path.join(directory, component)
+                if exists(path):
+                    matches.append(path)
+            paths = matches
+            continue
+        for directory in paths:
+            try:
+                entries = scandir_cached(directory)
+            except OSError:
+                continue
+            for entry in entries:
+                if entry.name.startswith('.') and not component.startswith('.'):
+                    continue
+                if not match(entry.name):
+                    continue
+                if need_dir and not entry.is_dir:
+                    continue
+                matches.append(entry.path)
+        paths = matches
+    return paths
 
 class ConcatenateGenerator(BaseGenerator):
     def __init__(self, logger: logging.Logger = None):
@@ -30,8 +167,7 @@ class ConcatenateGenerator(BaseGenerator):
         Raises:
             InputValidationError: If validation fails
         """
-        required_keys = ['raw_data', 'tables', 'processed_data_folder', 'grid_engine']
-        missing_keys = [key for key in required_keys if key not in config]
+        missing_keys = sorted(REQUIRED_KEYS - config.keys())
         if missing_keys:
             raise InputValidationError(f"Missing required configuration keys: {missing_keys}")
 
@@ -51,7 +187,43 @@ class ConcatenateGenerator(BaseGenerator):
         if not config['tables']:
             raise InputValidationError("No tables configured")
 
-    def find_input_files(self, table: TableConfig, raw_data_config: Dict[str, str]) -> List[str]:
+    def find_part_folders(self, raw_data_config: Dict[str, str]) -> List[str]:
+        """
+        Find all Part folders under the raw data root folder.
+        
+        Args:
+            raw_data_config: Raw data configuration with root_folder and pattern
+                
+        Returns:
+            Sorted list of Part folder paths
+                
+        Raises:
+            FileNotFoundError: If no Part folders are found
+        """
+        root_folder = raw_data_config['root_folder']
+        pattern = raw_data_config['pattern']
+        
+        part_search = os.path.join(root_folder, pattern)
+        self.logger.info(f"Searching for Part folders with pattern: {part_search}")
+        
+        part_folders = sorted(_scandir_match(root_folder, _compile_glob(pattern)))
+        self.logger.info(f"Found {len(part_folders)} Part folders")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            for folder in part_folders:
+                self.logger.debug(f"  - {folder}")
+        
+        if not part_folders:
+            raise FileNotFoundError(f"No Part folders found in {root_folder}")
+        
+        return part_folders
+
+    def find_input_files(
+        self,
+        table: TableConfig,
+        raw_data_config: Dict[str, str],
+        part_folders: Optional[List[str]] = None,
+        logger: Optional[logging.Logger] = None
+    ) -> List[str]:
         """
         Find all input files for a given table across all Part folders.
         Enhanced logging for debugging.
@@ -59,6 +231,9 @@ class ConcatenateGenerator(BaseGenerator):
         Args:
             table: Table configuration
             raw_data_config: Raw data configuration with root_folder and pattern
+            part_folders: Part folders found by find_part_folders, if already
+                known; otherwise they are searched for
+            logger: Logger for this table's messages, if not the generator's
                 
         Returns:
             List of file paths matching the pattern
@@ -66,58 +241,62 @@ class ConcatenateGenerator(BaseGenerator):
         Raises:
             FileNotFoundError: If no files are found
         """
+        logger = logger or self.logger
         root_folder = raw_data_config['root_folder']
-        pattern = raw_data_config['pattern']
-        self.logger.info(f"Searching in root folder: {root_folder}")
+        logger.info(f"Searching in root folder: {root_folder}")
         
         # Log the table configuration
-        self.logger.info(f"Processing table: {table.name}")
-        self.logger.info(f"Subfolder pattern: '{getattr(table, 'subfolder_pattern', '')}'")
-        self.logger.info(f"File pattern: {table.file_pattern}")
+        logger.info(f"Processing table: {table.name}")
+        logger.info(f"Subfolder pattern: '{getattr(table, 'subfolder_pattern', '')}'")
+        logger.info(f"File pattern: {table.file_pattern}")
         
         # Check for direct file path
-        if hasattr(table, 'file_path') and table.file_path:
+        if table.file_path:
             file_path = os.path.join(root_folder, table.file_path)
-            self.logger.info(f"Using direct file path: {file_path}")
+            logger.info(f"Using direct file path: {file_path}")
             if not os.path.exists(file_path):
                 raise FileNotFoundError(f"File not found: {file_path}")
             return [file_path]
 
         # First find all Part folders
-        part_search = os.path.join(root_folder, pattern)
-        self.logger.info(f"Searching for Part folders with pattern: {part_search}")
-        
-        part_folders = sorted(glob.glob(part_search))
-        self.logger.info(f"Found {len(part_folders)} Part folders:")
-        for folder in part_folders:
-            self.logger.info(f"  - {folder}")
-        
-        if not part_folders:
+        if part_folders is None:
+            part_folders = self.find_part_folders(raw_data_config)
+        elif not part_folders:
             raise FileNotFoundError(f"No Part folders found in {root_folder}")
         
+        # Construct search pattern based on whether subfolder is specified;
+        # it is the same in every Part folder
+        if table.subfolder_pattern:
+            file_search = os.path.join(table.subfolder_pattern, table.file_pattern)
+            found_in_suffix = f"/{table.subfolder_pattern}"
+        else:
+            file_search = table.file_pattern
+            found_in_suffix = ''
+        # Compiled once for the table and matched in every Part folder
+        compiled_search = _compile_glob(file_search)
+        sep = os.sep
+        
         all_files = []
         for part_folder in part_folders:
-            # Construct search path based on whether subfolder is specified
-            if table.subfolder_pattern:
-                search_path = os.path.join(part_folder, table.subfolder_pattern, table.file_pattern)
-            else:
-                search_path = os.path.join(part_folder, table.file_pattern)
+            # Part folders come from a directory listing, so never end in a separator
+            search_path = f"{part_folder}{sep}{file_search}"
                 
-            self.logger.info(f"Searching in {part_folder} with path: {search_path}")
+            logger.info(f"Searching in {part_folder} with path: {search_path}")
                 
             # Find matching files in this Part folder
-            files = sorted(glob.glob(search_path))
+            files = sorted(_scandir_match(part_folder, compiled_search))
             if files:
                 all_files.extend(files)
-                self.logger.info(
-                    f"Found {len(files)} files in {os.path.basename(part_folder)}"
-                    f"{f'/{table.subfolder_pattern}' if table.subfolder_pattern else ''}"
+                logger.info(
+                    f"Found {len(files)} files in {part_folder.rsplit(sep, 1)[-1]}"
+                    f"{found_in_suffix}"
                 )
-                self.logger.debug("Files found:")
-                for file in files:
-                    self.logger.debug(f"  - {file}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Files found:")
+                    for file in files:
+                        logger.debug(f"  - {file}")
             else:
-                self.logger.warning(f"No files found in {search_path}")
+                logger.warning(f"No files found in {search_path}")
         
         if not all_files:
             search_pattern = os.path.join(
@@ -129,18 +308,19 @@ class ConcatenateGenerator(BaseGenerator):
                 f"No files found for table {table.name} with pattern: {search_pattern}"
             )
                 
-        self.logger.info(
+        logger.info(
             f"Found total of {len(all_files)} files for table {table.name} "
             f"across {len(part_folders)} part folders"
         )
         
         # Log first and last few files to verify ordering
-        self.logger.info("First 3 files:")
-        for file in all_files[:3]:
-            self.logger.info(f"  - {file}")
-        self.logger.info("Last 3 files:")
-        for file in all_files[-3:]:
-            self.logger.info(f"  - {file}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("First 3 files:")
+            for file in all_files[:3]:
+                logger.debug(f"  - {file}")
+            logger.debug("Last 3 files:")
+            for file in all_files[-3:]:
+                logger.debug(f"  - {file}")
             
         return all_files
 
@@ -159,22 +339,39 @@ class ConcatenateGenerator(BaseGenerator):
         """
         self.validate_inputs(config)
         
-        # Find input files for each table
-        table_files = {}
-        tables: Dict[str, TableConfig] = {}
+        # Find input files for each table, listing the Part folders only once
+        tables = self._build_tables(config)
         
-        for name, table_config in config['tables'].items():
-            table = TableConfig.from_dict(name, table_config)
-            tables[name] = table
-            
+        try:
+            part_folders = self.find_part_folders(config['raw_data'])
+        except FileNotFoundError as e:
+            # Tables with a direct file path don't need Part folders
+            self.logger.warning(str(e))
+            part_folders = []
+        
+        def find_files(item):
+            name, table = item
+            # Each table's messages are buffered, so that they come out
+            # together and in table order even when searched concurrently
+            logger, buffer = _buffered_logger(self.logger)
             try:
-                table_files[name] = self.find_input_files(
+                files = self.find_input_files(
                     table, 
-                    config['raw_data']
+                    config['raw_data'],
+                    part_folders,
+                    logger
                 )
             except FileNotFoundError as e:
-                self.logger.warning(str(e))
-                table_files[name] = []
+                logger.warning(str(e))
+                files = []
+            return name, files, buffer.records
+        
+        # Results, and with them each table's messages, keep table order
+        table_files = {}
+        for name, files, records in map_maybe_parallel(find_files, tables.items()):
+            for record in records:
+                self.logger.handle(record)
+            table_files[name] = files
 
         # Validate grid engine config
         grid_engine = GridEngineConfig.from_dict(config['grid_engine'])
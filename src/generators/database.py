@@ -1,4 +1,5 @@
-from typing import Dict, Any, List
+from typing import Dict, Any, Iterator
+import io
 import os
 import logging
 from pathlib import Path
@@ -8,6 +9,9 @@ from src.generators.exceptions import InputValidationError, ConfigurationError
 from src.config.table_config import TableConfig
 from src.config.grid_engine import GridEngineConfig
 
+# Configuration keys this step requires
+REQUIRED_KEYS = frozenset({'tables', 'processed_data_folder', 'grid_engine', 'database'})
+
 class DatabaseGenerator(BaseGenerator):
     """Generator for creating SQLite database, loading data, and creating indexes."""
 
@@ -19,8 +23,7 @@ class DatabaseGenerator(BaseGenerator):
 
     def validate_inputs(self, config: Dict[str, Any]):
         """Validate all required inputs are present and valid."""
-        required_keys = ['tables', 'processed_data_folder', 'grid_engine', 'database']
-        missing_keys = [key for key in required_keys if key not in config]
+        missing_keys = sorted(REQUIRED_KEYS - config.keys())
         if missing_keys:
             raise InputValidationError(f"Missing required configuration keys: {missing_keys}")
 
@@ -51,21 +54,14 @@ class DatabaseGenerator(BaseGenerator):
         ]
         return f"CREATE TABLE {table_name}(\n    " + ",\n    ".join(columns) + "\n);"
 
-    def generate_index_sql(self, table_name: str, schema: Dict) -> List[str]:
-        """Generate CREATE INDEX statements for a table."""
-        if 'indexes' not in schema:
-            return []
-
-        statements = []
-        for columns in schema['indexes']:
+    def generate_index_sql(self, table_name: str, schema: Dict) -> Iterator[str]:
+        """Generate CREATE INDEX statements for a table, one at a time."""
+        for columns in schema.get('indexes', ()):
             if not isinstance(columns, list):
                 columns = [columns]  # Convert single column to list
             idx_name = f"idx_{table_name}_{'_'.join(columns)}"
             columns_str = ', '.join(columns)
-            statements.append(
-                f"CREATE INDEX IF NOT EXISTS {idx_name} ON {table_name} ({columns_str});"
-            )
-        return statements
+            yield f"CREATE INDEX IF NOT EXISTS {idx_name} ON {table_name} ({columns_str});"
 
     def generate(self, config: Dict[str, Any]) -> str:
         """Generate database creation and loading script."""
@@ -75,24 +71,24 @@ class DatabaseGenerator(BaseGenerator):
         grid_engine = GridEngineConfig.from_dict(config['grid_engine'])
         grid_engine.validate()
         
-        # Generate SQL statements
-        create_statements = []
-        index_statements = []
+        # Generate SQL statements, one per line, straight into the blocks
+        # the template inserts
+        create_sql = io.StringIO()
+        index_sql = io.StringIO()
         
         for table_name, schema in config['tables'].items():
-            create_statements.append(
-                self.generate_create_table_sql(table_name, schema)
-            )
-            index_statements.extend(
-                self.generate_index_sql(table_name, schema)
-            )
+            create_sql.write(self.generate_create_table_sql(table_name, schema))
+            create_sql.write('\n')
+            for statement in self.generate_index_sql(table_name, schema):
+                index_sql.write(statement)
+                index_sql.write('\n')
 
         # Generate script using template
         return self._render_template(
             processed_data_folder=config['processed_data_folder'],
             database_path=config['database'],
             grid_engine=grid_engine,
-            create_statements=create_statements,
-            index_statements=index_statements,
+            create_sql=create_sql.getvalue(),
+            index_sql=index_sql.getvalue(),
             tables=config['tables'].keys()
         )
@@ -3,10 +3,15 @@ from typing import Dict, Any, List
 import logging
 
 from src.generators.base import BaseGenerator
-from src.generators.exceptions import InputValidationError, FileNotFoundError
+from src.generators.exceptions import InputValidationError
 from src.config.table_config import TableConfig
 from src.config.grid_engine import GridEngineConfig
 from src.utils.table_validator import TableValidator
+from src.utils.paths import expand_path
+from src.utils.parallel import map_maybe_parallel
+
+# Configuration keys this step requires
+REQUIRED_KEYS = frozenset({'tables', 'processed_data_folder', 'grid_engine'})
 
 class DateConversionGenerator(BaseGenerator):
     """Generator for date format conversion scripts."""
@@ -28,13 +33,12 @@ class DateConversionGenerator(BaseGenerator):
         Raises:
             InputValidationError: If validation fails
         """
-        required_keys = ['tables', 'processed_data_folder', 'grid_engine']
-        missing_keys = [key for key in required_keys if key not in config]
+        missing_keys = sorted(REQUIRED_KEYS - config.keys())
         if missing_keys:
             raise InputValidationError(f"Missing required configuration keys: {missing_keys}")
 
         # Validate output directory exists
-        processed_data_folder = os.path.expandvars(config['processed_data_folder'])
+        processed_data_folder = expand_path(config['processed_data_folder'])
         if not os.path.isdir(processed_data_folder):
             raise InputValidationError(
                 f"Output directory does not exist: {processed_data_folder}"
@@ -47,6 +51,9 @@ class DateConversionGenerator(BaseGenerator):
     ) -> Dict[str, Dict[str, int]]:
         """
         Validate and get positions of date columns for all tables.
+        
+        Headers are read through map_maybe_parallel; the first table in
+        order that fails is reported.
 
         Args:
             tables: Dictionary of table configurations
@@ -58,12 +65,8 @@ class DateConversionGenerator(BaseGenerator):
         Raises:
             InputValidationError: If validation fails
         """
-        table_columns = {}
-
-        for table_name, table in tables.items():
-            if not hasattr(table, 'date_columns') or not table.date_columns:
-                continue
-
+        def table_positions(item):
+            table_name, table = item
             try:
                 # Find input file from previous step
                 input_file = self.validator.find_input_file(
@@ -84,12 +87,14 @@ class DateConversionGenerator(BaseGenerator):
                     table_name
                 )
 
-                table_columns[table_name] = positions
-
+            # TableValidator raises the builtin FileNotFoundError
             except (FileNotFoundError, ValueError) as e:
                 raise InputValidationError(f"Error validating {table_name}: {str(e)}")
 
-        return table_columns
+            return table_name, positions
+
+        date_tables = [item for item in tables.items() if item[1].date_columns]
+        return dict(map_maybe_parallel(table_positions, date_tables))
 
     def generate(self, config: Dict[str, Any]) -> str:
         """
@@ -107,10 +112,7 @@ class DateConversionGenerator(BaseGenerator):
         self.validate_inputs(config)
         
         # Initialize configurations
-        tables = {
-            name: TableConfig.from_dict(name, table_config)
-            for name, table_config in config['tables'].items()
-        }
+        tables = self._build_tables(config)
         
         grid_engine = GridEngineConfig.from_dict(config['grid_engine'])
         grid_engine.validate()
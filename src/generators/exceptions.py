@@ -1,3 +1,5 @@
+import builtins
+
 class GeneratorError(Exception):
     """Base exception for all generator-related errors."""
     pass
@@ -6,8 +8,13 @@ class InputValidationError(GeneratorError):
     """Raised when input validation fails."""
     pass
 
-class FileNotFoundError(GeneratorError):
-    """Raised when required input files are not found."""
+class FileNotFoundError(GeneratorError, builtins.FileNotFoundError):
+    """
+    Raised when required input files are not found.
+    
+    Also a builtin FileNotFoundError, so handlers for missing files catch it
+    whether or not they import this module.
+    """
     pass
 
 class ConfigurationError(GeneratorError):
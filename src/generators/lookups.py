@@ -1,12 +1,19 @@
 import os
-from typing import Dict, Any, List, Set
+from typing import Dict, Any, List, Optional, Set
 import logging
 
 from src.generators.base import BaseGenerator
 from src.generators.exceptions import InputValidationError, FileNotFoundError, ConfigurationError
 from src.config.table_config import TableConfig
 from src.config.grid_engine import GridEngineConfig
+from src.utils.dir_cache import scandir_cached
+from src.utils.headers import read_header
 from src.utils.table_validator import TableValidator
+from src.utils.paths import expand_path
+from src.utils.parallel import map_maybe_parallel
+
+# Configuration keys this step requires
+REQUIRED_KEYS = frozenset({'tables', 'processed_data_folder', 'lookups_folder', 'grid_engine'})
 
 class LookupGenerator(BaseGenerator):
     """Generator for applying lookup tables to convert codes to readable values."""
@@ -29,14 +36,13 @@ class LookupGenerator(BaseGenerator):
         Raises:
             InputValidationError: If validation fails
         """
-        required_keys = ['tables', 'processed_data_folder', 'lookups_folder', 'grid_engine']
-        missing_keys = [key for key in required_keys if key not in config]
+        missing_keys = sorted(REQUIRED_KEYS - config.keys())
         if missing_keys:
             raise InputValidationError(f"Missing required configuration keys: {missing_keys}")
 
         # Validate directories exist
         for dir_key in ['processed_data_folder', 'lookups_folder']:
-            dir_path = os.path.expandvars(config[dir_key])
+            dir_path = expand_path(config[dir_key])
             if not os.path.isdir(dir_path):
                 raise InputValidationError(
                     f"{dir_key} directory does not exist: {dir_path}"
@@ -60,16 +66,33 @@ class LookupGenerator(BaseGenerator):
         Raises:
             FileNotFoundError: If any lookup file is missing
         """
-        validated_files = set()
+        validated_files: Set[str] = set()
         missing_files = []
         
+        # Nothing to check, so don't list the lookups folder
+        if not any(table.lookup_columns for table in tables.values()):
+            return validated_files
+        
+        # List the lookups folder once rather than checking each file
+        try:
+            existing_files = {
+                entry.name for entry in scandir_cached(lookups_folder) if entry.is_file
+            }
+        except OSError:
+            existing_files = set()
+        
         for table_name, table in tables.items():
             if not table.lookup_columns:
                 continue
                 
             for lookup_file in table.lookup_columns.values():
                 file_path = os.path.join(lookups_folder, lookup_file)
-                if not os.path.isfile(file_path):
+                # Lookup files in subdirectories aren't in the listing
+                if os.sep in lookup_file:
+                    exists = os.path.isfile(file_path)
+                else:
+                    exists = lookup_file in existing_files
+                if not exists:
                     missing_files.append(f"- {lookup_file} (for {table_name})")
                 else:
                     validated_files.add(file_path)
@@ -81,31 +104,41 @@ class LookupGenerator(BaseGenerator):
             
         return validated_files
 
+    def check_lookup_format(self, file_path: str) -> Optional[str]:
+        """
+        Check a lookup file is a 2-column TSV.
+        
+        Args:
+            file_path: Path to the lookup file
+            
+        Returns:
+            Description of the problem, or None if the format is valid
+        """
+        try:
+            header = read_header(file_path)
+            if len(header) != 2:
+                return (
+                    f"- {os.path.basename(file_path)} "
+                    f"(found {len(header)} columns, expected 2)"
+                )
+        except Exception as e:
+            return f"- {os.path.basename(file_path)} (error: {str(e)})"
+        return None
+
     def validate_lookup_formats(self, lookup_files: Set[str]):
         """
         Validate lookup file formats (should be 2-column TSV: code\tdescription).
         
+        Headers are read through map_maybe_parallel.
+        
         Args:
             lookup_files: Set of lookup file paths to validate
             
         Raises:
             ConfigurationError: If any lookup file has invalid format
         """
-        invalid_files = []
-        
-        for file_path in lookup_files:
-            try:
-                with open(file_path, 'r') as f:
-                    header = f.readline().strip().split('\t')
-                    if len(header) != 2:
-                        invalid_files.append(
-                            f"- {os.path.basename(file_path)} "
-                            f"(found {len(header)} columns, expected 2)"
-                        )
-            except Exception as e:
-                invalid_files.append(
-                    f"- {os.path.basename(file_path)} (error: {str(e)})"
-                )
+        results = map_maybe_parallel(self.check_lookup_format, lookup_files)
+        invalid_files = [result for result in results if result is not None]
         
         if invalid_files:
             raise ConfigurationError(
@@ -118,7 +151,7 @@ class LookupGenerator(BaseGenerator):
         Find the most recent input file for a table, checking s02 then s01.
         Handles environment variable expansion in paths.
         """
-        expanded_folder = os.path.expandvars(processed_data_folder)
+        expanded_folder = expand_path(processed_data_folder)
         
         # Try s02 first (output from date conversion)
         s02_path = os.path.join(
@@ -158,6 +191,9 @@ class LookupGenerator(BaseGenerator):
         """
         Get positions of columns needed for lookups.
         Handles environment variable expansion in paths.
+        
+        Headers are read through map_maybe_parallel; the first table in
+        order that fails is reported.
 
         Args:
             tables: Dictionary of table configurations
@@ -169,12 +205,8 @@ class LookupGenerator(BaseGenerator):
         Raises:
             InputValidationError: If validation fails
         """
-        col_positions = {}
-
-        for table_name, table in tables.items():
-            if not table.lookup_columns:
-                continue
-
+        def table_positions(item):
+            table_name, table = item
             try:
                 # Find most recent input file
                 input_file = self.find_latest_input_file(
@@ -189,12 +221,13 @@ class LookupGenerator(BaseGenerator):
                     table_name
                 )
 
-                col_positions[table_name] = positions
-
             except (FileNotFoundError, ValueError) as e:
                 raise InputValidationError(f"Error validating {table_name}: {str(e)}")
 
-        return col_positions
+            return table_name, positions
+
+        lookup_tables = [item for item in tables.items() if item[1].lookup_columns]
+        return dict(map_maybe_parallel(table_positions, lookup_tables))
         
     def generate(self, config: Dict[str, Any]) -> str:
         """
@@ -212,10 +245,7 @@ class LookupGenerator(BaseGenerator):
         self.validate_inputs(config)
         
         # Initialize configurations
-        tables = {
-            name: TableConfig.from_dict(name, table_config)
-            for name, table_config in config['tables'].items()
-        }
+        tables = self._build_tables(config)
         
         grid_engine = GridEngineConfig.from_dict(config['grid_engine'])
         grid_engine.validate()
@@ -1,44 +1,175 @@
 import os
+import copy
+import collections
+import functools
+import importlib
+import json
 import yaml
 import logging
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from pathlib import Path
 
-from src.generators.concatenate import ConcatenateGenerator
-from src.generators.dates import DateConversionGenerator
-from src.generators.lookups import LookupGenerator
-from src.generators.codelists import CodelistGenerator
-from src.generators.annotations import CodelistAnnotationGenerator
-from src.generators.database import DatabaseGenerator
+from src.generators.base import BaseGenerator, TABLES_OBJ_KEY
+from src.config.table_config import TableConfig
 from src.pipeline.steps import PipelineStep
 from src.utils.logging import setup_logging
 
+# Prefer the libyaml-backed loader, falling back to the pure Python one
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+# Module and class of the generator for each step, imported on first use so
+# that generating one step doesn't load every generator
+GENERATOR_CLASSES: Dict[str, Tuple[str, str]] = {
+    PipelineStep.CONCATENATE.value: ('src.generators.concatenate', 'ConcatenateGenerator'),
+    PipelineStep.CONVERT_DATES.value: ('src.generators.dates', 'DateConversionGenerator'),
+    PipelineStep.APPLY_LOOKUPS.value: ('src.generators.lookups', 'LookupGenerator'),
+    PipelineStep.PREPARE_CODELISTS.value: ('src.generators.codelists', 'CodelistGenerator'),
+    PipelineStep.ANNOTATE_TABLES.value: ('src.generators.annotations', 'CodelistAnnotationGenerator'),
+    PipelineStep.CREATE_DATABASE.value: ('src.generators.database', 'DatabaseGenerator'),
+    # Add other generators here as they're implemented
+}
+
+# Top-level fields every configuration file must have
+REQUIRED_FIELDS = frozenset({'raw_data', 'processed_data_folder', 'tables', 'grid_engine'})
+
+# Suffix of the parsed-config cache written next to each config file
+CONFIG_CACHE_SUFFIX = '.cache.json'
+
+def _read_config_cache(cache_path: str, mtime_ns: int, size: int) -> Optional[dict]:
+    """
+    Read a parsed configuration from its JSON cache.
+    
+    Args:
+        cache_path: Path to the JSON cache
+        mtime_ns: Modification time of the YAML file, in nanoseconds
+        size: Size of the YAML file in bytes
+        
+    Returns:
+        Cached configuration, or None if there is no cache or it was written
+        for a different version of the YAML file
+    """
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+    
+    if (not isinstance(cached, dict)
+            or cached.get('mtime_ns') != mtime_ns
+            or cached.get('size') != size):
+        return None
+    return cached.get('config')
+
+def _write_config_cache(cache_path: str, mtime_ns: int, size: int, config: dict) -> None:
+    """
+    Write a parsed configuration to its JSON cache, atomically.
+    
+    Nothing is written if the configuration doesn't survive a round trip
+    through JSON unchanged (e.g. YAML dates or non-string keys), and failing
+    to write the cache, such as in a read-only directory, is not an error.
+    
+    Args:
+        cache_path: Path to the JSON cache
+        mtime_ns: Modification time of the YAML file, in nanoseconds
+        size: Size of the YAML file in bytes
+        config: Parsed configuration
+    """
+    try:
+        content = json.dumps({'mtime_ns': mtime_ns, 'size': size, 'config': config})
+    except (TypeError, ValueError):
+        return
+    if json.loads(content)['config'] != config:
+        return
+    
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(content)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+
+@functools.lru_cache(maxsize=32)
+def _parse_config(config_path: str, mtime_ns: int, size: int) -> dict:
+    """
+    Parse a YAML configuration file, cached on its path, mtime and size.
+    
+    The parsed configuration is also kept in a JSON file next to the YAML,
+    which is much faster to load, and reused until the YAML changes.
+    """
+    cache_path = config_path + CONFIG_CACHE_SUFFIX
+    config = _read_config_cache(cache_path, mtime_ns, size)
+    if config is not None:
+        return config
+    
+    with open(config_path, 'r', encoding='utf-8') as f:
+        config = yaml.load(f, Loader=SafeLoader)
+    
+    _write_config_cache(cache_path, mtime_ns, size, config)
+    return config
+
+# Permissions of generated scripts
+SCRIPT_MODE = 0o755
+
+def _write_script(filepath: str, content: str) -> None:
+    """
+    Write a generated script, creating it executable.
+    
+    The mode is given when the file is created, so it only needs changing
+    afterwards if the umask removed bits or the file already existed with
+    another mode.
+    
+    Args:
+        filepath: Path to write the script to
+        content: Script content
+    """
+    data = memoryview(content.encode('utf-8'))
+    fd = os.open(filepath, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, SCRIPT_MODE)
+    try:
+        while data:
+            data = data[os.write(fd, data):]
+        if os.fstat(fd).st_mode & 0o777 != SCRIPT_MODE:
+            os.fchmod(fd, SCRIPT_MODE)
+    finally:
+        os.close(fd)
+
 class PipelineGenerator:
     def __init__(self, config_path: str):
         """Initialize pipeline generator with configuration file path."""
         self.config = self._load_config(config_path)
         self.logger = setup_logging()
         
-        # Initialize generators
-        self.generators = {
-            PipelineStep.CONCATENATE.value: ConcatenateGenerator(self.logger),
-            PipelineStep.CONVERT_DATES.value: DateConversionGenerator(self.logger),
-            PipelineStep.APPLY_LOOKUPS.value: LookupGenerator(self.logger),
-            PipelineStep.PREPARE_CODELISTS.value: CodelistGenerator(self.logger),
-            PipelineStep.ANNOTATE_TABLES.value: CodelistAnnotationGenerator(self.logger),
-            PipelineStep.CREATE_DATABASE.value: DatabaseGenerator(self.logger),
-            # Add other generators here as they're implemented
-        }
+        # Generators by step, created when their step is first generated
+        self.generators: Dict[str, BaseGenerator] = {}
+
+    def _get_generator(self, step: str) -> Optional[BaseGenerator]:
+        """Get the generator for a step, importing and creating it on first use."""
+        generator = self.generators.get(step)
+        if generator is None and step in GENERATOR_CLASSES:
+            module_name, class_name = GENERATOR_CLASSES[step]
+            generator_class = getattr(importlib.import_module(module_name), class_name)
+            generator = self.generators[step] = generator_class(self.logger)
+        return generator
 
     def _load_config(self, config_path: str) -> dict:
         """Load and validate configuration file."""
-        with open(config_path, 'r') as f:
-            config = yaml.safe_load(f)
+        config_path = os.path.abspath(config_path)
+        stat = os.stat(config_path)
+
+        # Copy so that callers never modify the cached parse
+        config = copy.deepcopy(
+            _parse_config(config_path, stat.st_mtime_ns, stat.st_size)
+        )
         
-        required_fields = ['raw_data', 'processed_data_folder', 'tables', 'grid_engine']
-        for field in required_fields:
-            if field not in config:
-                raise ValueError(f"Missing required field '{field}' in config")
+        missing_fields = sorted(REQUIRED_FIELDS - config.keys())
+        if missing_fields:
+            raise ValueError(f"Missing required fields {missing_fields} in config")
         
         return config
 
@@ -54,28 +185,33 @@ class PipelineGenerator:
         
         os.makedirs(output_dir, exist_ok=True)
         
-        working_config = self.config.copy()
-        working_config['script_output_dir'] = output_dir
+        # Run settings are layered over the config rather than copying it;
+        # anything written to the working config lands in the overlay
+        working_config = collections.ChainMap({
+            'script_output_dir': output_dir,
+            # Build the table configurations once rather than in every step
+            TABLES_OBJ_KEY: {
+                name: TableConfig.from_dict(name, table_config)
+                for name, table_config in self.config['tables'].items()
+            }
+        }, self.config)
         
         # Generate scripts for requested steps
         for step in steps:
-            if step not in self.generators:
-                self.logger.warning(f"Generator not implemented for step: {step}")
+            generator = self._get_generator(step)
+            if generator is None:
+                self.logger.warning("Generator not implemented for step: %s", step)
                 continue
                 
             try:
-                script_content = self.generators[step].generate(working_config)
+                script_content = generator.generate(working_config)
                 
                 # Use fixed step number based on full pipeline order
-                step_num = PipelineStep.get_step_number(step)
-                filename = f's{step_num:02d}_{step}.sh'
-                filepath = os.path.join(output_dir, filename)
+                filepath = os.path.join(output_dir, PipelineStep.filename_for(step))
                 
-                with open(filepath, 'w') as f:
-                    f.write(script_content)
-                os.chmod(filepath, 0o755)
+                _write_script(filepath, script_content)
                 
-                self.logger.info(f"Generated script: {filepath}")
+                self.logger.info("Generated script: %s", filepath)
                 
             except Exception as e:
                 raise
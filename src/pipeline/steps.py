@@ -1,5 +1,6 @@
 from enum import Enum
-from typing import List
+from types import MappingProxyType
+from typing import List, Mapping, Tuple
 
 class PipelineStep(Enum):
     CONCATENATE = 'concatenate'
@@ -12,29 +13,48 @@ class PipelineStep(Enum):
     @classmethod
     def get_all_steps(cls) -> List[str]:
         """Get list of all possible steps in correct order."""
-        return [step.value for step in cls]
+        return list(_ALL_STEPS)
     
     @classmethod
     def validate_step(cls, step: str) -> bool:
         """Validate if a step name is valid."""
-        return step in cls.get_all_steps()
+        return step in _STEP_INDEX
     
     @classmethod
     def get_step_number(cls, step: str) -> int:
         """Get the fixed step number regardless of which steps are being run."""
         try:
-            return cls.get_all_steps().index(step) + 1
-        except ValueError:
+            return _STEP_INDEX[step] + 1
+        except KeyError:
             raise ValueError(f"Invalid step: {step}")
     
     @classmethod
-    def get_step_dependencies(cls) -> dict:
-        """Define dependencies between steps."""
-        return {
-            cls.CONCATENATE.value: [],
-            cls.CONVERT_DATES.value: [cls.CONCATENATE.value],
-            cls.APPLY_LOOKUPS.value: [cls.CONVERT_DATES.value],
-            cls.PREPARE_CODELISTS.value: [],
-            cls.ANNOTATE_TABLES.value: [cls.APPLY_LOOKUPS.value, cls.PREPARE_CODELISTS.value],
-            cls.CREATE_DATABASE.value: [cls.ANNOTATE_TABLES.value]
-        }
+    def filename_for(cls, step: str) -> str:
+        """Get the script filename for a step, numbered by its place in the pipeline."""
+        try:
+            return _STEP_FILENAMES[step]
+        except KeyError:
+            raise ValueError(f"Invalid step: {step}")
+    
+    @classmethod
+    def get_step_dependencies(cls) -> Mapping[str, Tuple[str, ...]]:
+        """Define dependencies between steps (a read-only mapping)."""
+        return _DEPENDENCIES
+
+# Step names in pipeline order and their 0-based positions, computed once;
+# they can't be class attributes, as those would become members of the Enum
+_ALL_STEPS = tuple(step.value for step in PipelineStep)
+_STEP_INDEX = {step: i for i, step in enumerate(_ALL_STEPS)}
+_STEP_FILENAMES = {step: f's{i + 1:02d}_{step}.sh' for i, step in enumerate(_ALL_STEPS)}
+
+# Steps each step depends on, built once and shared read-only
+_DEPENDENCIES: Mapping[str, Tuple[str, ...]] = MappingProxyType({
+    PipelineStep.CONCATENATE.value: (),
+    PipelineStep.CONVERT_DATES.value: (PipelineStep.CONCATENATE.value,),
+    PipelineStep.APPLY_LOOKUPS.value: (PipelineStep.CONVERT_DATES.value,),
+    PipelineStep.PREPARE_CODELISTS.value: (),
+    PipelineStep.ANNOTATE_TABLES.value: (
+        PipelineStep.APPLY_LOOKUPS.value, PipelineStep.PREPARE_CODELISTS.value
+    ),
+    PipelineStep.CREATE_DATABASE.value: (PipelineStep.ANNOTATE_TABLES.value,)
+})
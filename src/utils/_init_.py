@@ -1,6 +1,11 @@
 """Utility functions and helpers."""
 
-from .logging import setup_logging
+from .dir_cache import DirEntryInfo, scandir_cached
+from .headers import read_header, read_header_line
+from .logging import setup_logging, stop_logging
+from .parallel import map_maybe_parallel
+from .paths import expand_path
 from .table_validator import TableValidator
 
-__all__ = ['setup_logging', 'TableValidator']
+__all__ = ['DirEntryInfo', 'expand_path', 'map_maybe_parallel', 'read_header', 'read_header_line', 'scandir_cached',
+           'setup_logging', 'stop_logging', 'TableValidator']
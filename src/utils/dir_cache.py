@@ -0,0 +1,45 @@
+import os
+import functools
+from typing import NamedTuple, Tuple
+
+class DirEntryInfo(NamedTuple):
+    """Name, path and file type of a directory entry, as reported by os.scandir."""
+    name: str
+    path: str
+    is_file: bool
+    is_dir: bool
+
+@functools.lru_cache(maxsize=1024)
+def _list_directory(path: str, mtime_ns: int) -> Tuple[DirEntryInfo, ...]:
+    """
+    List a directory, cached on path and modification time.
+    
+    Entries are copied out of the DirEntry objects before the scandir
+    iterator is closed.
+    """
+    with os.scandir(path) as entries:
+        return tuple(
+            DirEntryInfo(entry.name, entry.path, entry.is_file(), entry.is_dir())
+            for entry in entries
+        )
+
+def scandir_cached(path: str) -> Tuple[DirEntryInfo, ...]:
+    """
+    List a directory once for as long as it is unchanged.
+    
+    A directory's modification time changes whenever an entry is added,
+    removed or renamed, so the listing is keyed on it. Steps and tables
+    share a listing, and a directory that changes, e.g. between two
+    generate() calls in one process, is listed again. Each call costs a
+    stat rather than a full listing.
+    
+    Args:
+        path: Directory to list
+        
+    Returns:
+        Tuple of entries, in the order os.scandir returned them
+        
+    Raises:
+        OSError: If the directory can't be listed; failures are not cached
+    """
+    return _list_directory(path, os.stat(path).st_mtime_ns)
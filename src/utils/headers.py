@@ -0,0 +1,67 @@
+import os
+from typing import List
+
+# Bytes read per os.read call while looking for the end of the header line
+HEADER_READ_BYTES = 4096
+
+def read_header_bytes(file_path: str) -> bytes:
+    """
+    Read the raw header line of a file.
+    
+    Reads with os.read in small blocks until the first newline, so no
+    buffered text file object is created just to read one line.
+    
+    Args:
+        file_path: Path to the file
+        
+    Returns:
+        First line of the file, without its newline
+        
+    Raises:
+        OSError: If the file can't be opened or read
+    """
+    fd = os.open(file_path, os.O_RDONLY)
+    try:
+        chunks = []
+        while True:
+            chunk = os.read(fd, HEADER_READ_BYTES)
+            newline = chunk.find(b'\n')
+            if newline >= 0:
+                chunks.append(chunk[:newline])
+                break
+            if not chunk:
+                break
+            chunks.append(chunk)
+    finally:
+        os.close(fd)
+    return b''.join(chunks)
+
+def read_header_line(file_path: str) -> str:
+    """
+    Read the header line of a tab-delimited file.
+    
+    Args:
+        file_path: Path to the file
+        
+    Returns:
+        First line of the file with surrounding whitespace removed
+        
+    Raises:
+        OSError: If the file can't be opened or read
+    """
+    return read_header_bytes(file_path).decode().strip()
+
+def read_header(file_path: str) -> List[str]:
+    """
+    Read the column names from the header of a tab-delimited file.
+    
+    Args:
+        file_path: Path to the file
+        
+    Returns:
+        List of column names
+        
+    Raises:
+        OSError: If the file can't be opened or read
+    """
+    return read_header_line(file_path).split('\t')
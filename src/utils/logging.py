@@ -1,16 +1,34 @@
+import atexit
 import logging
+import logging.handlers
+import queue
 from typing import Optional
 
+# Logger configured by the first call, returned directly by later calls
+_LOGGER: Optional[logging.Logger] = None
+
+# Listener writing the logger's queued records, until stop_logging is called
+_LISTENER: Optional[logging.handlers.QueueListener] = None
+
 def setup_logging(level: int = logging.INFO) -> logging.Logger:
     """
     Setup logging configuration.
     
+    Records are handed to a queue and written to the console by a background
+    QueueListener, so logging calls don't wait on the terminal. Call
+    stop_logging to flush the queue before printing anything else; it is
+    also called at exit.
+    
     Args:
         level: Logging level to use
         
     Returns:
         Configured logger instance
     """
+    global _LOGGER, _LISTENER
+    if _LOGGER is not None and _LOGGER.level == level:
+        return _LOGGER
+    
     # Create logger
     logger = logging.getLogger('PipelineGenerator')
     logger.setLevel(level)
@@ -25,6 +43,37 @@ def setup_logging(level: int = logging.INFO) -> logging.Logger:
         )
         console_handler.setFormatter(formatter)
         
-        logger.addHandler(console_handler)
+        # Write to the console from the listener's thread
+        log_queue: queue.Queue = queue.Queue(-1)
+        listener = logging.handlers.QueueListener(
+            log_queue, console_handler, respect_handler_level=True
+        )
+        listener.start()
+        _LISTENER = listener
+        atexit.register(stop_logging)
+        
+        logger.addHandler(logging.handlers.QueueHandler(log_queue))
 
+    _LOGGER = logger
     return logger
+
+def stop_logging() -> None:
+    """
+    Write out any queued log records and stop the background listener.
+    
+    The logger's console handler is then attached to it directly, so records
+    logged afterwards are written synchronously. Calling it again does
+    nothing.
+    """
+    global _LISTENER
+    if _LISTENER is None:
+        return
+    listener, _LISTENER = _LISTENER, None
+    listener.stop()
+    
+    if _LOGGER is not None:
+        for handler in list(_LOGGER.handlers):
+            if isinstance(handler, logging.handlers.QueueHandler):
+                _LOGGER.removeHandler(handler)
+        for handler in listener.handlers:
+            _LOGGER.addHandler(handler)
@@ -0,0 +1,40 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable, List, TypeVar
+
+T = TypeVar('T')
+R = TypeVar('R')
+
+# Minimum number of items before they are processed in a thread pool
+PARALLEL_MIN_ITEMS = 4
+
+def map_maybe_parallel(
+    fn: Callable[[T], R],
+    items: Iterable[T],
+    min_items: int = PARALLEL_MIN_ITEMS
+) -> List[R]:
+    """
+    Apply fn to every item, in a thread pool when there are enough items.
+
+    The generators use this for per-table and per-file checks (header reads,
+    file and directory probes) that mostly wait on the filesystem, often a
+    networked one, so running them in threads overlaps those waits. Below
+    min_items a pool costs more than it saves, and fn is applied serially.
+    Either way results come back in item order, and the first item whose
+    call raises has its exception propagated, so errors match a serial run.
+
+    Args:
+        fn: Function to apply to each item
+        items: Items to process
+        min_items: Minimum number of items before a thread pool is used
+
+    Returns:
+        List of fn's results, in item order
+    """
+    items = list(items)
+    if len(items) < min_items:
+        return [fn(item) for item in items]
+
+    max_workers = min(32, (os.cpu_count() or 1) * 4, len(items))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(fn, items))
@@ -0,0 +1,18 @@
+import functools
+import os
+
+@functools.lru_cache(maxsize=128)
+def expand_path(path: str) -> str:
+    """
+    Expand environment variables in a configured path.
+    
+    Results are cached, since every generator expands the same few folders
+    and the environment doesn't change during a run.
+    
+    Args:
+        path: Path that may contain $VAR or ${VAR} references
+        
+    Returns:
+        Path with environment variables expanded
+    """
+    return os.path.expandvars(path)
@@ -1,23 +1,47 @@
 import os
-import glob
-from typing import Dict, List, Optional
+import functools
+from typing import Dict, List, Optional, Tuple
 import logging
 
+from src.utils.headers import read_header
+from src.utils.paths import expand_path
+
+@functools.lru_cache(maxsize=256)
+def _read_header_positions(
+    file_path: str,
+    mtime_ns: int,
+    size: int
+) -> Tuple[Tuple[str, ...], Dict[str, int]]:
+    """
+    Read a file's header and its column positions, cached on path, mtime and size.
+    
+    The cache is shared by every TableValidator, so a file validated by
+    several steps is only read once while it is unchanged.
+    """
+    header = tuple(read_header(file_path))
+    return header, {col: idx + 1 for idx, col in enumerate(header)}
+
 class TableValidator:
     """Utility class to validate table columns and track positions."""
     
     def __init__(self, logger: Optional[logging.Logger] = None):
         self.logger = logger or logging.getLogger(__name__)
 
-    def get_header_columns(self, file_path: str) -> List[str]:
-        """Get column names from file header."""
+    def _get_header_positions(
+        self,
+        file_path: str
+    ) -> Tuple[Tuple[str, ...], Dict[str, int]]:
+        """Get the header of a file and its 1-based column positions."""
         try:
-            with open(file_path, 'r') as f:
-                header = f.readline().strip().split('\t')
-            return header
+            stat = os.stat(file_path)
+            return _read_header_positions(file_path, stat.st_mtime_ns, stat.st_size)
         except IOError as e:
             raise ValueError(f"Error reading header from {file_path}: {str(e)}")
 
+    def get_header_columns(self, file_path: str) -> List[str]:
+        """Get column names from file header."""
+        return list(self._get_header_positions(file_path)[0])
+
     def validate_columns(
         self,
         file_path: str,
@@ -27,29 +51,33 @@ class TableValidator:
         """
         Validate required columns exist in file and get their positions.
         
+        Only the header line of the file is read, so this is cheap to call
+        for large files and safe to call from several threads at once.
+        
         Args:
             file_path: Path to the file to validate
             required_columns: List of required column names
             table_name: Name of the table being validated
             
         Returns:
-            Dict mapping column names to their 1-based positions (for awk)
+            Dict mapping the required column names to their 1-based
+            positions (for awk)
             
         Raises:
             ValueError: If required columns are missing
         """
-        header = self.get_header_columns(file_path)
-        positions = {col: idx + 1 for idx, col in enumerate(header)}
+        header, positions = self._get_header_positions(file_path)
         
         missing_cols = [col for col in required_columns if col not in positions]
         if missing_cols:
             raise ValueError(
                 f"Required columns missing in {table_name}:\n"
                 f"Missing: {missing_cols}\n"
-                f"Available columns: {header}"
+                f"Available columns: {list(header)}"
             )
-            
-        return positions
+        
+        # Only the required columns are used, so only their positions are returned
+        return {col: positions[col] for col in required_columns}
 
     def find_input_file(
         self,
@@ -72,12 +100,14 @@ class TableValidator:
             FileNotFoundError: If input file doesn't exist
         """
         file_path = os.path.join(
-            os.path.expandvars(output_dir),
+            expand_path(output_dir),
             table_name,
             f"{prefix}_{table_name}.txt"
         )
         
-        if not os.path.exists(file_path):
+        try:
+            os.stat(file_path)
+        except OSError:
             raise FileNotFoundError(
                 f"Required input file not found: {file_path}"
             )